@@ -112,58 +112,62 @@ Return a result to be added to the tendency contributions (a kernel function).
 @inline function (p::ForcingFromFile{FTS,V})(i, j, k, grid, clock, fields) where {FTS,V}
     value = @inbounds p.fts_value[i, j, k, Time(clock.time)]
     λ = @inbounds p.fts_λ[i, j, k, Time(clock.time)]
-    result = 0.0
-    result += @inbounds ifelse(
-        λ > 1 && value > -990,
-        forcing_term_u(λ, value, i, j, k, grid, fields[i, j, k, p.fieldname]),
-        0,
+    field = @inbounds fields[i, j, k, p.fieldname]
+    valid = value > -990
+    # λ ranges are disjoint, so a single select chain picks the active term
+    result = ifelse(
+        λ > 1,
+        forcing_term_u(λ, value, i, j, k, grid, field),
+        ifelse(
+            λ < -1,
+            forcing_term_v(λ, value, i, j, k, grid, field),
+            ifelse(-1 < λ < 1, forcing_term_relax(λ, value, i, j, k, grid, field), zero(value)),
+        ),
     )
-    result += @inbounds ifelse(
-        λ < -1 && value > -990,
-        forcing_term_v(λ, value, i, j, k, grid, fields[i, j, k, p.fieldname]),
-        0,
-    )
-    result += @inbounds ifelse(
-        -1 < λ < 1 && value > -990,
-        forcing_term_relax(λ, value, i, j, k, grid, fields[i, j, k, p.fieldname]),
-        0,
-    )
-    return result
+    return ifelse(valid, result, zero(result))
 end
 
 regularize_forcing(forcing::ForcingFromFile, field, field_name, model_field_names) = forcing
 
 function native_times_to_seconds(native_times, start_time=native_times[1])
-    times = []
-    for native_time in native_times
-        time = native_time - start_time
-        time = Second(time).value
-        push!(times, time)
-    end
-    return times
+    return map(native_time -> Second(native_time - start_time).value, native_times)
 end
 
-function load_from_netcdf(; path::String, var_name::String, grid_size::Tuple, time_indices_in_memory::Tuple)
+function load_from_netcdf(;
+    path::String,
+    var_name::String,
+    grid_size::Tuple,
+    time_indices_in_memory::Tuple,
+    FT::DataType=Float64,
+)
     ds = NCDataset(path)
-    var = ds[var_name]
-    native_times = ds["time"]
+    # raw access: the forcing kernel handles the -999 fill value itself
+    var = variable(ds, var_name)
 
-    data = zeros(Float64, (grid_size[1:end]..., length(time_indices_in_memory)))
+    data = Array{FT}(undef, (grid_size[1:end]..., length(time_indices_in_memory)))
+    # reused read buffer, so a slab read does not allocate a temporary
+    slab = Array{eltype(var)}(undef, size(var)[1:end-1])
     j = 1
     for i in time_indices_in_memory
-        data[:, :, :, j] .= var[:, :, :, i]
+        NCDatasets.load!(var, slab, :, :, :, i)
+        data[:, :, :, j] .= slab
         j += 1
     end
-    times = convert.(Int64, native_times_to_seconds(native_times))
 
     close(ds)
-    return data, times
+    return data
 end
 
 """ Update data in the FieldTimeSeries, e.g. in ForcingFromFile forcing structures. """
 function set!(fts::NetCDFFTS, path::String=fts.path, name::String=fts.name)
     ti = time_indices(fts)
-    data, _ = load_from_netcdf(; path, var_name=name, grid_size=size(fts)[1:end-1], time_indices_in_memory=ti)
+    data = load_from_netcdf(;
+        path,
+        var_name=name,
+        grid_size=size(fts)[1:end-1],
+        time_indices_in_memory=ti,
+        FT=eltype(fts),
+    )
 
     copyto!(interior(fts, :, :, :, :), data)
     fill_halo_regions!(fts)
@@ -176,15 +180,15 @@ Return a custom ForcingFromFile forcing, which is a structure keeping 2 FieldTim
 with forcing values and forcing 'lambdas'.
 By default both FieldTimeSeries keep only 2 times indices in memory.
 """
-function forcing_get_tuple(filepath, var_name, grid, time_indices_in_memory, backend)
+function forcing_get_tuple(filepath, var_name, grid, times, time_indices_in_memory, backend)
     field_name = oceananigans_fieldname[Symbol(var_name)]
     LX, LY, LZ = DATA_LOCATION[field_name]
     grid_size_tupled = size.(nodes(grid, (LX(), LY(), LZ())))
     grid_size = Tuple(x[1] for x in grid_size_tupled)
+    FT = eltype(grid)
 
-    data, times = load_from_netcdf(; path=filepath, var_name, grid_size, time_indices_in_memory)
-    dataλ, timesλ =
-        load_from_netcdf(; path=filepath, var_name=var_name * "_lambda", grid_size, time_indices_in_memory)
+    data = load_from_netcdf(; path=filepath, var_name, grid_size, time_indices_in_memory, FT)
+    dataλ = load_from_netcdf(; path=filepath, var_name=var_name * "_lambda", grid_size, time_indices_in_memory, FT)
 
     fts = FieldTimeSeries{LX,LY,LZ}(
         grid,
@@ -199,7 +203,7 @@ function forcing_get_tuple(filepath, var_name, grid, time_indices_in_memory, bac
 
     ftsλ = FieldTimeSeries{LX,LY,LZ}(
         grid,
-        timesλ;
+        times;
         backend,
         time_indexing=Cyclical(),
         path=filepath,
@@ -223,12 +227,14 @@ function forcing_from_file(; grid, filepath, tracers)
         grid.underlying_grid.Nz == ds.dim["Nz"] ||
         throw(DimensionMismatch("forcing file dimensions not equal to grid dimensions"))
     forcing_variables_names = (map(String, tracers) ∪ ("u", "v")) ∩ keys(ds)
+    # all forcing variables in a file share one time axis
+    times = native_times_to_seconds(ds["time"][:])
     close(ds)
 
     backend = NetCDFBackend(2)
     time_indices_in_memory = (1, length(backend))
     result = mapreduce(
-        var_name -> forcing_get_tuple(filepath, var_name, grid, time_indices_in_memory, backend),
+        var_name -> forcing_get_tuple(filepath, var_name, grid, times, time_indices_in_memory, backend),
         merge,
         forcing_variables_names,
     )
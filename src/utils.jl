@@ -11,8 +11,7 @@ function progress(sim)
     u, v, w = ocean.model.velocities
     T = ocean.model.tracers.T
 
-    Tmax = maximum(interior(T))
-    Tmin = minimum(interior(T))
+    Tmin, Tmax = extrema(interior(T))
 
     umax = (maximum(abs, interior(u)),
             maximum(abs, interior(v)),
@@ -59,7 +58,7 @@ function netcdf_to_jld2(netcdf_file::String, jld2_file::String)
     data_dict = Dict()
     for varname in keys(ds)
         data_dict[varname] = convert(Array, ds[varname])
-        print(size(convert(Array, ds[varname])))
+        print(size(data_dict[varname]))
     end
 
     @save jld2_file data_dict